@@ -5,7 +5,7 @@ import sys
 from pathlib import Path
 from datetime import date, timedelta
 import pandas as pd
-import altair as alt
+import numpy as np
 
 # Add parent directory to path
 sys.path.insert(0, str(Path(__file__).parent.parent.parent))
@@ -15,24 +15,234 @@ from etl.config import SEASON_START, SEASON_END, ACTIVE_PLAYERS_PER_DAY
 
 st.set_page_config(page_title="Manager Portal", page_icon="👤")
 
+
+# Player Stats table labels and number formats, applied client-side by st.dataframe
+PLAYER_STATS_COLUMNS = {
+    'player_name': 'Player',
+    'team': 'Team',
+    'games_played': 'GP',
+    'season_avg': st.column_config.NumberColumn('Season Avg', format='%.2f'),
+    'last_game_points': st.column_config.NumberColumn('Last Game', format='%.2f'),
+    'last_5_avg': st.column_config.NumberColumn('Last 5 Avg', format='%.2f'),
+    'total_points': st.column_config.NumberColumn('Total Pts', format='%.2f'),
+    'trend': 'Trend',
+}
+
+
+# Cached loaders - Streamlit reruns this script on every widget interaction.
+# League-wide reference data is shared across sessions via cache_resource
+# (no per-rerun copy), so these frames must be treated as read-only.
+@st.cache_resource(ttl=60, show_spinner=False)
+def _load_managers():
+    return data_loader.load_managers()
+
+
+@st.cache_resource(ttl=60, show_spinner=False)
+def _managers_by_id():
+    return _load_managers().set_index('manager_id', drop=False)
+
+
+@st.cache_resource(ttl=60, show_spinner=False)
+def _manager_select_options():
+    # label -> manager_id for the selectbox, plus manager_id -> option position
+    managers = _load_managers()
+    manager_labels = managers['manager_name'] + ' (' + managers['team_name'] + ')'
+    manager_options = dict(zip(manager_labels, managers['manager_id']))
+    id_to_pos = {mid: i + 1 for i, mid in enumerate(manager_options.values())}
+    return manager_options, id_to_pos
+
+
+@st.cache_resource(ttl=60, show_spinner=False)
+def _load_players():
+    return data_loader.load_players()
+
+
+@st.cache_resource(ttl=60, show_spinner=False)
+def _load_game_schedule():
+    return data_loader.load_game_schedule()
+
+
+@st.cache_resource(ttl=60, show_spinner=False)
+def _schedule_by_date():
+    return dict(list(_load_game_schedule().groupby('game_date')))
+
+
+@st.cache_resource(ttl=60, show_spinner=False)
+def _schedule_with_game_num():
+    # Matchups keyed by game number within each date (1, 2, ...) - see _scores_with_matchup
+    schedule = _load_game_schedule().sort_values(['game_date', 'game_id'])
+    return schedule[['game_date', 'home_team', 'away_team']].assign(
+        game_num=schedule.groupby('game_date').cumcount() + 1
+    )
+
+
+# Standings change whenever scores do, so they live in cache_data with the scores:
+# the admin flows' st.cache_data.clear() then refreshes both together
+@st.cache_data(ttl=60, show_spinner=False)
+def _standings_with_details():
+    return standings_updater.get_standings_with_details()
+
+
+@st.cache_data(ttl=60, show_spinner=False)
+def _scores_with_matchup(manager_id):
+    # One schedule join per manager, shared by the Recent Games table and the chart
+    scores = _scores_by_manager().get(manager_id)
+    if scores is None or 'game_id' not in scores.columns:
+        return scores
+
+    scores = scores.assign(game_id=scores['game_id'].astype(int)).sort_values(['game_date', 'game_id'])
+
+    # Match on game number within each date: uploaded game_ids can reset per
+    # day (1,2,3,4) while the schedule has sequential game_ids (1-56).
+    # Scores are in (game_date, game_id) order, so a cumcount gives the
+    # position without rank's extra sort
+    scores['game_num'] = scores.groupby('game_date').cumcount() + 1
+
+    scores = scores.merge(_schedule_with_game_num(), on=['game_date', 'game_num'], how='left')
+    scores['matchup'] = scores['home_team'] + ' v ' + scores['away_team']
+
+    # Chart labels: "1/5 Hive v Mist"
+    # Month/day from datetime fields (strftime's %-m/%-d is not portable to Windows)
+    game_days = pd.to_datetime(scores['game_date']).dt
+    scores['game_label'] = (
+        game_days.month.astype(str) + '/' + game_days.day.astype(str) + ' ' + scores['matchup']
+    )
+
+    # Left merge keeps the chronological order from above
+    return scores.reset_index(drop=True)
+
+
+@st.cache_data(ttl=60, show_spinner=False)
+def _recent_scores(manager_id, n=10):
+    scores = _scores_with_matchup(manager_id)
+    if scores is None:
+        return pd.DataFrame()
+
+    # game_date holds python dates (object dtype), which nlargest can't rank,
+    # so partial-select on a datetime64 copy of it instead of a full sort
+    keys = ['_game_day', 'game_id'] if 'game_id' in scores.columns else ['_game_day']
+    ranked = scores.assign(_game_day=pd.to_datetime(scores['game_date'])).nlargest(n, keys)
+    return ranked.drop(columns='_game_day')
+
+
+@st.cache_data(ttl=60, show_spinner=False)
+def _scores_by_date_chart(manager_id):
+    # Fallback chart for scores without game_id: ship only the two plotted columns
+    import altair as alt  # deferred: only needed once a chart is drawn
+
+    scores = _scores_by_manager()[manager_id][['game_date', 'total_points']].sort_values('game_date')
+    return alt.Chart(scores).mark_bar().encode(
+        x=alt.X('game_date:O', title='Date'),
+        y=alt.Y('total_points:Q', title='Fantasy Points')
+    )
+
+
+@st.cache_data(ttl=60, show_spinner=False)
+def _draft_complete():
+    return draft_engine.validate_draft_complete()
+
+
+@st.cache_data(ttl=60, show_spinner=False)
+def _load_roster(manager_id):
+    return draft_engine.get_manager_roster(manager_id)
+
+
+@st.cache_data(ttl=60, show_spinner=False)
+def _load_lineups():
+    return data_loader.load_lineups()
+
+
+@st.cache_data(ttl=60, show_spinner=False)
+def _lineups_by_manager_date():
+    # Sorted (manager_id, game_date) index turns per-game lineup lookups into binary searches
+    lineups = _load_lineups()
+    if lineups is None:
+        return None
+    return lineups.set_index(['manager_id', 'game_date']).sort_index()
+
+
+@st.cache_data(ttl=60, show_spinner=False)
+def _lineup_dates_by_manager():
+    # Sorted lineup dates per manager, for has_prior_lineup's binary search
+    return lineup_manager.lineup_dates_by_manager(_load_lineups())
+
+
+@st.cache_data(ttl=60, show_spinner=False)
+def _benched_by_manager():
+    # Bench rows split per manager once, as (game_date, player_id)
+    lineups = _load_lineups()
+    if lineups is None:
+        return {}
+    bench = lineups.loc[lineups['status'] == 'bench', ['manager_id', 'game_date', 'player_id']]
+    return {mid: group.drop(columns='manager_id') for mid, group in bench.groupby('manager_id')}
+
+
+@st.cache_data(ttl=60, show_spinner=False)
+def _load_manager_daily_scores():
+    return data_loader.load_manager_daily_scores()
+
+
+@st.cache_data(ttl=60, show_spinner=False)
+def _load_player_game_scores():
+    return data_loader.load_player_game_scores()
+
+
+@st.cache_data(ttl=60, show_spinner=False)
+def _load_transaction_log():
+    return data_loader.load_transaction_log()
+
+
+@st.cache_data(ttl=60, show_spinner=False)
+def _transactions_by_manager():
+    # Newest first, split per manager once
+    transactions = _load_transaction_log()
+    if transactions is None or transactions.empty:
+        return {}
+    return dict(list(transactions.sort_values('timestamp', ascending=False).groupby('manager_id')))
+
+
+@st.cache_data(ttl=300, show_spinner=False)
+def _player_stats_table():
+    # League-wide season aggregates, projected to the displayed columns (player_id
+    # kept for filtering) with the trend emoji mapped once via a category rename.
+    # Labels/formats come from PLAYER_STATS_COLUMNS. The admin upload clears all cache_data
+    stats = player_stats.get_all_player_stats()
+    if stats.empty:
+        return stats
+
+    return stats[['player_id'] + list(PLAYER_STATS_COLUMNS)].assign(
+        trend=lambda d: d['trend'].cat.rename_categories({
+            'hot': '🔥',
+            'cold': '🥶',
+            'neutral': '-'
+        })
+    )
+
+
+@st.cache_data(ttl=60, show_spinner=False)
+def _scores_by_manager():
+    scores = _load_manager_daily_scores()
+    if scores is None or scores.empty:
+        return {}
+    return dict(list(scores.groupby('manager_id')))
+
+
 st.title("👤 Manager Portal")
 
 # Manager selection
-managers = data_loader.load_managers()
+managers = _load_managers()
+managers_by_id = _managers_by_id()
 
 if 'selected_manager_id' not in st.session_state:
     st.session_state.selected_manager_id = None
 
-manager_options = {
-    f"{row['manager_name']} ({row['team_name']})": row['manager_id']
-    for _, row in managers.iterrows()
-}
+manager_options, id_to_pos = _manager_select_options()
+option_labels = ["-- Select Manager --"] + list(manager_options.keys())
 
 selected_option = st.selectbox(
     "Select Your Team:",
-    options=["-- Select Manager --"] + list(manager_options.keys()),
-    index=0 if st.session_state.selected_manager_id is None else
-          list(manager_options.values()).index(st.session_state.selected_manager_id) + 1
+    options=option_labels,
+    index=id_to_pos.get(st.session_state.selected_manager_id, 0)
 )
 
 if selected_option != "-- Select Manager --":
@@ -40,37 +250,45 @@ if selected_option != "-- Select Manager --":
     st.session_state.selected_manager_id = manager_id
 
     # Get manager details
-    manager_result = managers[managers['manager_id'] == manager_id]
-    if manager_result.empty:
+    if manager_id not in managers_by_id.index:
         st.error(f"❌ Manager ID {manager_id} not found in system!")
         st.stop()
 
-    manager_row = manager_result.iloc[0]
+    manager_row = managers_by_id.loc[manager_id]
     st.subheader(f"Welcome, {manager_row['manager_name']}!")
     st.caption(f"Team: {manager_row['team_name']}")
 
     # Check if draft is complete
-    if not draft_engine.validate_draft_complete():
+    if not _draft_complete():
         st.warning("⚠️ Draft not complete yet. Contact the admin to run the draft!")
         st.stop()
 
-    # Tabs
-    tab1, tab2, tab3, tab4, tab5, tab6 = st.tabs(["My Roster", "Set Lineup", "My Scores", "Standings", "Player Stats", "Transaction Log"])
+    # Shared by several views - load once per rerun
+    roster = _load_roster(manager_id)
+    schedule = _load_game_schedule()
 
-    with tab1:
-        st.header("My Roster")
+    # Tab picker - unlike st.tabs, only the selected view's body executes on a rerun
+    active_tab = st.radio(
+        "View",
+        ["My Roster", "Set Lineup", "My Scores", "Standings", "Player Stats", "Transaction Log"],
+        horizontal=True,
+        key="active_tab",
+        label_visibility="collapsed"
+    )
 
-        roster = draft_engine.get_manager_roster(manager_id)
+    if active_tab == "My Roster":
+        st.header("My Roster")
 
         if not roster.empty:
-            display_roster = roster[['player_name', 'team', 'status']].copy()
-            display_roster.columns = ['Player', 'Unrivaled Team', 'Status']
+            display_roster = roster[['player_name', 'team', 'status']].rename(columns={
+                'player_name': 'Player', 'team': 'Unrivaled Team', 'status': 'Status'
+            })
 
             st.dataframe(display_roster, hide_index=True, use_container_width=True)
         else:
             st.info("No roster found. Contact admin.")
 
-    with tab2:
+    elif active_tab == "Set Lineup":
         st.header("Set Daily Lineup")
 
         # Date selector (default to today, clamped within season range)
@@ -98,22 +316,19 @@ if selected_option != "-- Select Manager --":
                 st.success(f"✅ Lineup unlocked. Locks in {hours}h {minutes}m")
 
         # Show games scheduled for this date
-        schedule = data_loader.load_game_schedule()
-        games_today = schedule[schedule['game_date'] == lineup_date]
+        games_today = _schedule_by_date().get(lineup_date, schedule.iloc[:0])
 
         if not games_today.empty:
             st.subheader(f"📅 Games on {lineup_date.strftime('%B %d, %Y')}")
 
-            # Create a nice display of games
-            for _, game in games_today.iterrows():
-                game_time = game['game_time']
-                col1, col2, col3 = st.columns([2, 1, 2])
-                with col1:
-                    st.write(f"**{game['away_team']}**")
-                with col2:
-                    st.write(f"@ {game_time} ET")
-                with col3:
-                    st.write(f"**{game['home_team']}**")
+            # Render all games as one markdown table
+            games_md = "\n".join(
+                f"| **{away}** | @ {game_time} ET | **{home}** |"
+                for away, game_time, home in zip(
+                    games_today['away_team'], games_today['game_time'], games_today['home_team']
+                )
+            )
+            st.markdown("| Away | Time | Home |\n|:---|:---:|:---|\n" + games_md)
 
             st.caption(f"💡 Tip: Players on these teams will score points today")
             st.divider()
@@ -121,27 +336,23 @@ if selected_option != "-- Select Manager --":
             st.info(f"ℹ️ No games scheduled for {lineup_date}")
             st.divider()
 
-        # Get current lineup
-        current_lineup = lineup_manager.get_manager_lineup(manager_id, lineup_date)
+        # Get current lineup from the cached lineups instead of re-reading lineups.csv
+        lineups = _load_lineups()
+        lineups_idx = _lineups_by_manager_date()
 
-        if not current_lineup.empty and 'status' in current_lineup.columns and 'player_id' in current_lineup.columns:
-            active_ids = current_lineup[current_lineup['status'] == 'active']['player_id'].tolist()
+        if lineups_idx is not None and (manager_id, lineup_date) in lineups_idx.index:
+            current_lineup = lineups_idx.loc[[(manager_id, lineup_date)]]
+            active_ids = current_lineup.loc[current_lineup['status'] == 'active', 'player_id'].tolist()
             lineup_status = "custom"
         else:
             # No lineup set for this date - will use sticky lineup logic
-            active_ids = lineup_manager.get_active_players_for_scoring(manager_id, lineup_date)
+            active_ids = lineup_manager.get_active_players_for_scoring(manager_id, lineup_date, lineups)
 
             # Determine if this is from previous day or default
-            all_lineups = data_loader.load_lineups()
-            if all_lineups is not None:
-                past = all_lineups[(all_lineups['manager_id'] == manager_id) &
-                                   (all_lineups['game_date'] < lineup_date)]
-                lineup_status = "previous" if not past.empty else "default"
-            else:
-                lineup_status = "default"
-
-        # Get roster
-        roster = draft_engine.get_manager_roster(manager_id)
+            has_prior = lineup_manager.has_prior_lineup(
+                manager_id, lineup_date, dates_by_manager=_lineup_dates_by_manager()
+            )
+            lineup_status = "previous" if has_prior else "default"
 
         if not roster.empty:
             # Show lineup status
@@ -155,60 +366,82 @@ if selected_option != "-- Select Manager --":
             st.subheader(f"Select {ACTIVE_PLAYERS_PER_DAY} Active Players:")
 
             selected_players = []
+            active_id_set = set(active_ids)
 
-            for _, player in roster.iterrows():
-                is_active = player['player_id'] in active_ids
+            # Stable player_id order keeps lineup widget order deterministic across reruns
+            lineup_roster = roster.sort_values('player_id')
 
-                # Add status indicator (check status_injury from merged DataFrame)
-                injury_status = player.get('status_injury', player.get('status', 'active'))
-                status_emoji = "🔴" if injury_status == 'injured' else ""
-                player_label = f"{player['player_name']} ({player['team']}) {status_emoji}".strip()
+            # Precompute per-player widget state in one vectorized pass
+            widget_keys = ("player_" + lineup_roster['player_id'].astype(str) + f"_{lineup_date}").to_numpy()
 
-                checkbox = st.checkbox(
-                    player_label,
-                    value=is_active,
-                    key=f"player_{player['player_id']}_{lineup_date}",
-                    disabled=is_locked or injury_status == 'injured'
-                )
+            # Injury status per player (prefer status_injury from merged DataFrame)
+            injury_statuses = lineup_roster.get(
+                'status_injury', lineup_roster.get('status', pd.Series('active', index=lineup_roster.index))
+            )
+            is_injured = injury_statuses.eq('injured').fillna(False).to_numpy(dtype=bool)
+            player_labels = (
+                lineup_roster['player_name'] + ' (' + lineup_roster['team'].fillna('N/A') + ') '
+                + np.where(is_injured, "🔴", "")
+            ).str.strip().to_numpy()
+            is_active = lineup_roster['player_id'].isin(active_id_set).to_numpy()
+            is_disabled = is_injured | is_locked
+
+            # Checkboxes live in a form so toggling them doesn't rerun the page
+            with st.form("lineup_form"):
+                # Plain checkboxes (not st.data_editor) so injured players can be disabled per row
+                for player_id, label, key, active, disabled in zip(
+                    lineup_roster['player_id'].tolist(), player_labels, widget_keys, is_active, is_disabled
+                ):
+                    checkbox = st.checkbox(
+                        label,
+                        value=bool(active),
+                        key=key,
+                        disabled=bool(disabled)
+                    )
 
-                if checkbox:
-                    selected_players.append(player['player_id'])
+                    if checkbox:
+                        selected_players.append(player_id)
 
-            # Show count
-            st.caption(f"Selected: {len(selected_players)} / {ACTIVE_PLAYERS_PER_DAY}")
+                submitted = st.form_submit_button("Save Lineup", type="primary", disabled=is_locked)
 
-            # Save button
-            if not is_locked:
+            # Save lineup on submit
+            if submitted:
                 if len(selected_players) != ACTIVE_PLAYERS_PER_DAY:
                     st.warning(f"⚠️ Must select exactly {ACTIVE_PLAYERS_PER_DAY} players (currently: {len(selected_players)})")
-                    st.button("Save Lineup", disabled=True)
                 else:
-                    if st.button("Save Lineup", type="primary"):
-                        success, message = lineup_manager.save_lineup(
-                            manager_id, lineup_date, selected_players
-                        )
+                    success, message = lineup_manager.save_lineup(
+                        manager_id, lineup_date, selected_players
+                    )
 
-                        if success:
-                            st.success(message)
-                            st.rerun()
-                        else:
-                            st.error(message)
+                    if success:
+                        _load_lineups.clear()
+                        _lineups_by_manager_date.clear()
+                        _lineup_dates_by_manager.clear()
+                        _benched_by_manager.clear()
+                        _load_transaction_log.clear()
+                        _transactions_by_manager.clear()
+                        st.success(message)
+                        st.rerun()
+                    else:
+                        st.error(message)
         else:
             st.info("No roster found")
 
-    with tab3:
+    elif active_tab == "My Scores":
         st.header("My Scores")
 
-        # Load scores
-        all_scores = data_loader.load_manager_daily_scores()
+        # Load scores (player scores are shared by the recent-games table and the chart)
+        all_scores = _load_manager_daily_scores()
+        player_game_scores = _load_player_game_scores()
 
         if all_scores is not None and not all_scores.empty:
-            manager_scores = all_scores[all_scores['manager_id'] == manager_id]
+            manager_scores = _scores_by_manager().get(manager_id, all_scores.iloc[:0])
 
             if not manager_scores.empty:
                 # Season total
-                total = manager_scores['total_points'].sum()
-                games = len(manager_scores)  # Each row is now one game
+                points = manager_scores['total_points'].to_numpy()
+                total = points.sum()
+                games = points.size  # Each row is now one game
                 avg = total / games if games > 0 else 0
 
                 col1, col2, col3 = st.columns(3)
@@ -224,70 +457,18 @@ if selected_option != "-- Select Manager --":
 
                 # Sort by date then game_id for proper order
                 if 'game_id' in manager_scores.columns:
-                    recent = manager_scores.sort_values(['game_date', 'game_id'], ascending=False).head(10).copy()
-
-                    # Convert game_id to int
-                    recent['game_id'] = recent['game_id'].astype(int)
-
-                    # Get game schedule to show matchups
-                    schedule = data_loader.load_game_schedule()
-
-                    # Create game number within each date for matching
-                    # This handles case where uploaded game_id resets per day (1,2,3,4)
-                    # but schedule has sequential game_ids (1-56)
-                    recent['game_num'] = recent.groupby('game_date')['game_id'].rank(method='dense').astype(int)
-                    schedule_copy = schedule.copy()
-                    schedule_copy['game_num'] = schedule_copy.groupby('game_date')['game_id'].rank(method='dense').astype(int)
-
-                    recent = recent.merge(
-                        schedule_copy[['game_date', 'game_num', 'home_team', 'away_team']],
-                        on=['game_date', 'game_num'],
-                        how='left'
-                    )
-
-                    # Create matchup column
-                    recent['matchup'] = recent['home_team'] + ' v ' + recent['away_team']
-
-                    # Calculate benched players who actually played
-                    # For each game, count roster players who played but were benched
-                    lineups = data_loader.load_lineups()
-                    player_scores = data_loader.load_player_game_scores()
-                    roster = draft_engine.get_manager_roster(manager_id)
-                    roster_player_ids = roster['player_id'].tolist() if not roster.empty else []
-
-                    benched_counts = []
-                    for _, row in recent.iterrows():
-                        game_date = row['game_date']
-                        game_id = row['game_id']
-
-                        # Get lineup for this manager/date
-                        my_lineup = lineups[
-                            (lineups['manager_id'] == manager_id) &
-                            (lineups['game_date'] == game_date)
-                        ]
-
-                        # Get benched players from lineup
-                        benched_player_ids = my_lineup[my_lineup['status'] == 'bench']['player_id'].tolist()
+                    # Already joined to the schedule (home/away teams, matchup)
+                    recent = _recent_scores(manager_id)
 
-                        # Get players who actually played in this game
-                        game_player_scores = player_scores[player_scores['game_id'] == game_id]
-                        players_who_played = game_player_scores['player_id'].tolist()
-
-                        # Count benched players who are on roster AND played in this game
-                        benched_who_played = [
-                            p for p in benched_player_ids
-                            if p in players_who_played and p in roster_player_ids
-                        ]
-                        benched_counts.append(len(benched_who_played))
-
-                    recent['benched_players'] = benched_counts
-
-                    display_recent = recent[['game_date', 'matchup', 'total_points', 'active_players_count']].copy()
-                    display_recent.columns = ['Date', 'Matchup', 'Points', 'Active Players']
+                    display_recent = recent[['game_date', 'matchup', 'total_points', 'active_players_count']].rename(columns={
+                        'game_date': 'Date', 'matchup': 'Matchup',
+                        'total_points': 'Points', 'active_players_count': 'Active Players'
+                    })
                 else:
-                    recent = manager_scores.sort_values('game_date', ascending=False).head(10)
-                    display_recent = recent[['game_date', 'total_points', 'active_players_count']].copy()
-                    display_recent.columns = ['Date', 'Points', 'Active Players']
+                    recent = _recent_scores(manager_id)
+                    display_recent = recent[['game_date', 'total_points', 'active_players_count']].rename(columns={
+                        'game_date': 'Date', 'total_points': 'Points', 'active_players_count': 'Active Players'
+                    })
 
                 st.dataframe(display_recent, hide_index=True, use_container_width=True)
 
@@ -295,124 +476,56 @@ if selected_option != "-- Select Manager --":
                 st.subheader("Points by Game")
 
                 # Create a label for each game
-                chart_data = manager_scores.sort_values(['game_date', 'game_id'] if 'game_id' in manager_scores.columns else 'game_date').copy()
-                if 'game_id' in chart_data.columns:
-                    # Convert game_id to int
-                    chart_data['game_id'] = chart_data['game_id'].astype(int)
-
-                    # Get game schedule to show matchups
-                    schedule = data_loader.load_game_schedule()
-
-                    # Create game number within each date for matching
-                    chart_data['game_num'] = chart_data.groupby('game_date')['game_id'].rank(method='dense').astype(int)
-                    schedule_copy = schedule.copy()
-                    schedule_copy['game_num'] = schedule_copy.groupby('game_date')['game_id'].rank(method='dense').astype(int)
-
-                    chart_data = chart_data.merge(
-                        schedule_copy[['game_date', 'game_num', 'home_team', 'away_team']],
-                        on=['game_date', 'game_num'],
-                        how='left'
-                    )
-
-                    # Sort by game_date and game_id to ensure chronological order
-                    chart_data = chart_data.sort_values(['game_date', 'game_id']).reset_index(drop=True)
+                if 'game_id' in manager_scores.columns:
+                    import altair as alt  # deferred: only the My Scores chart needs it
 
-                    # Create user-friendly labels: "1/5 Hive v Mist"
-                    chart_data['game_label'] = (
-                        pd.to_datetime(chart_data['game_date']).dt.strftime('%-m/%-d') + ' ' +
-                        chart_data['home_team'] + ' v ' + chart_data['away_team']
-                    )
+                    # Schedule-joined (with game labels) and sorted chronologically
+                    chart_data = _scores_with_matchup(manager_id)
 
                     # Calculate bench points using game_id mapping
-                    lineups_all = data_loader.load_lineups()
-                    player_game_scores = data_loader.load_player_game_scores()
-                    players = data_loader.load_players()
-                    game_id_mapping = data_loader.load_game_id_mapping()
-
-                    if lineups_all is not None and player_game_scores is not None and players is not None:
-                        # Get benched players for this manager
-                        manager_lineups = lineups_all[lineups_all['manager_id'] == manager_id]
-                        benched = manager_lineups[manager_lineups['status'] == 'bench']
-
-                        # Calculate bench points per game
-                        bench_points_by_game = []
-                        for _, game_row in chart_data.iterrows():
-                            player_game_id = game_row['game_id']  # This is from manager_scores (1, 2 per date)
-                            game_date = game_row['game_date']
-                            home_team = game_row['home_team']
-                            away_team = game_row['away_team']
-
-                            # Get benched players for this date
-                            benched_date = benched[benched['game_date'] == game_date]['player_id'].tolist()
-
-                            # Filter benched players whose team is playing in this game
-                            benched_in_game = []
-                            for player_id in benched_date:
-                                player_info = players[players['player_id'] == player_id]
-                                if not player_info.empty:
-                                    player_team = player_info['team'].iloc[0]
-                                    if player_team == home_team or player_team == away_team:
-                                        benched_in_game.append(player_id)
-
-                            # Get scores for benched players who played in this game
-                            # Match using game_date and player_game_id from player_game_scores
-                            benched_scores = player_game_scores[
-                                (player_game_scores['game_date'] == game_date) &
-                                (player_game_scores['game_id'] == player_game_id) &
-                                (player_game_scores['player_id'].isin(benched_in_game)) &
-                                (player_game_scores['status'] == 'played')
-                            ]
-
-                            bench_total = benched_scores['fantasy_points'].sum() if not benched_scores.empty else 0.0
-                            bench_points_by_game.append({
-                                'game_id': player_game_id,
-                                'game_date': game_date,
-                                'bench_points': bench_total
-                            })
-
-                        bench_df = pd.DataFrame(bench_points_by_game)
+                    benched = _benched_by_manager().get(manager_id)
+                    players = _load_players()
+
+                    if benched is not None and player_game_scores is not None and players is not None:
+                        # Benched players per date, tagged with their team
+                        benched = benched.drop_duplicates().merge(players[['player_id', 'team']], on='player_id')
+
+                        # One row per (game, team playing in it)
+                        game_teams = chart_data[['game_date', 'game_id', 'home_team', 'away_team']].melt(
+                            id_vars=['game_date', 'game_id'], value_name='team'
+                        ).drop(columns='variable').dropna(subset=['team'])
+
+                        # Benched players whose team played in each game, joined to their
+                        # scores (game_id from manager_scores matches player_game_scores)
+                        played = player_game_scores.loc[
+                            player_game_scores['status'] == 'played',
+                            ['game_date', 'game_id', 'player_id', 'fantasy_points']
+                        ]
+                        bench_points = benched.merge(game_teams, on=['game_date', 'team']).merge(
+                            played, on=['game_date', 'game_id', 'player_id']
+                        ).groupby(['game_date', 'game_id'])['fantasy_points'].sum()
 
                         # Merge bench points with chart data
                         chart_data = chart_data.merge(
-                            bench_df,
-                            on=['game_id', 'game_date'],
+                            bench_points.rename('bench_points').reset_index(),
+                            on=['game_date', 'game_id'],
                             how='left'
                         )
                         chart_data['bench_points'] = chart_data['bench_points'].fillna(0)
                     else:
                         chart_data['bench_points'] = 0
 
-                    # Rename total_points to active_points for clarity
-                    chart_data['active_points'] = chart_data['total_points']
-
-                    # Create stacked data for visualization
-                    chart_long = pd.DataFrame([])
-                    for _, row in chart_data.iterrows():
-                        chart_long = pd.concat([
-                            chart_long,
-                            pd.DataFrame([{
-                                'game_label': row['game_label'],
-                                'point_type': 'Bench Points',
-                                'points': row['bench_points']
-                            }]),
-                            pd.DataFrame([{
-                                'game_label': row['game_label'],
-                                'point_type': 'Active Points',
-                                'points': row['active_points']
-                            }])
-                        ], ignore_index=True)
-
-                    # Convert game_label to ordered categorical to preserve sort order
+                    # Create stacked data for visualization (one row per game and point type)
+                    chart_long = chart_data[['game_label', 'bench_points', 'total_points']].rename(columns={
+                        'bench_points': 'Bench Points', 'total_points': 'Active Points'
+                    }).melt(id_vars='game_label', var_name='point_type', value_name='points')
+
+                    # Chronological x order, passed straight to Altair as an explicit sort
                     unique_labels = chart_data['game_label'].unique().tolist()
-                    chart_long['game_label'] = pd.Categorical(
-                        chart_long['game_label'],
-                        categories=unique_labels,
-                        ordered=True
-                    )
 
                     # Create Altair stacked bar chart
                     chart = alt.Chart(chart_long).mark_bar().encode(
-                        x=alt.X('game_label:N', title='Game', sort=None),
+                        x=alt.X('game_label:N', title='Game', sort=unique_labels),
                         y=alt.Y('points:Q', title='Fantasy Points'),
                         color=alt.Color('point_type:N',
                                       scale=alt.Scale(
@@ -427,38 +540,29 @@ if selected_option != "-- Select Manager --":
 
                     st.altair_chart(chart, use_container_width=True)
                 else:
-                    st.bar_chart(
-                        chart_data,
-                        x='game_date',
-                        y='total_points',
-                        use_container_width=True
-                    )
+                    st.altair_chart(_scores_by_date_chart(manager_id), use_container_width=True)
             else:
                 st.info("No scores yet. Set lineups to start scoring!")
         else:
             st.info("No scores available yet.")
 
-    with tab4:
+    elif active_tab == "Standings":
         st.header("League Standings")
 
-        standings = standings_updater.get_standings_with_details()
+        standings = _standings_with_details()
 
         if not standings.empty:
-            # Highlight this manager
-            def highlight_row(row):
-                if row['manager_id'] == manager_id:
-                    return ['background-color: lightblue'] * len(row)
-                return [''] * len(row)
-
             display_standings = standings[[
                 'rank', 'team_name', 'total_points',
                 'games_with_scores', 'avg_points_per_day'
-            ]].copy()
+            ]].rename(columns={
+                'rank': 'Rank', 'team_name': 'Team', 'total_points': 'Total Points',
+                'games_with_scores': 'Games', 'avg_points_per_day': 'Avg/Game'
+            })
 
-            display_standings.columns = [
-                'Rank', 'Team', 'Total Points',
-                'Games', 'Avg/Game'
-            ]
+            # Mark this manager's row (cheaper than a pandas Styler highlight)
+            is_me = (standings['manager_id'] == manager_id).to_numpy()
+            display_standings.insert(0, '', np.where(is_me, '👉', ''))
 
             st.dataframe(
                 display_standings,
@@ -466,95 +570,60 @@ if selected_option != "-- Select Manager --":
                 use_container_width=True
             )
 
-            # Show your rank
-            my_rank = standings_updater.get_manager_rank(manager_id)
+            # Show your rank (already on the cached standings - no second load)
+            my_rank = int(standings['rank'].to_numpy()[is_me][0]) if is_me.any() else 0
             if my_rank > 0:
                 st.info(f"Your Current Rank: #{my_rank}")
         else:
             st.info("Standings not available yet.")
 
-    with tab5:
+    elif active_tab == "Player Stats":
         st.header("Player Stats Dashboard")
 
-        # Get all player stats
-        all_stats = player_stats.get_all_player_stats()
+        # Get all player stats (display columns and trend emoji already applied)
+        display_stats = _player_stats_table()
 
-        if not all_stats.empty:
+        if not display_stats.empty:
             # Show my roster players first
-            roster = draft_engine.get_manager_roster(manager_id)
-            my_player_ids = roster['player_id'].tolist() if not roster.empty else []
+            my_player_ids = set(roster['player_id'])
 
             # Filter to my players
-            my_players = all_stats[all_stats['player_id'].isin(my_player_ids)]
+            is_mine = display_stats['player_id'].isin(my_player_ids)
+            display_stats = display_stats.drop(columns='player_id')
 
-            if not my_players.empty:
+            if is_mine.any():
                 st.subheader("Your Roster Performance")
 
-                # Add trend emoji
-                my_players['trend_emoji'] = my_players['trend'].map({
-                    'hot': '🔥',
-                    'cold': '🥶',
-                    'neutral': '-'
-                })
-
-                display_my = my_players[[
-                    'player_name', 'team', 'games_played',
-                    'season_avg', 'last_game_points', 'last_5_avg', 'total_points', 'trend_emoji'
-                ]].copy()
-
-                display_my.columns = [
-                    'Player', 'Team', 'GP',
-                    'Season Avg', 'Last Game', 'Last 5 Avg', 'Total Pts', 'Trend'
-                ]
-
                 st.dataframe(
-                    display_my,
+                    display_stats[is_mine],
                     hide_index=True,
-                    use_container_width=True
+                    use_container_width=True,
+                    column_config=PLAYER_STATS_COLUMNS
                 )
 
             st.divider()
             st.subheader("All Players")
 
-            # Add trend emoji
-            all_stats['trend_emoji'] = all_stats['trend'].map({
-                'hot': '🔥',
-                'cold': '🥶',
-                'neutral': '-'
-            })
-
-            display_all = all_stats[[
-                'player_name', 'team', 'games_played',
-                'season_avg', 'last_game_points', 'last_5_avg', 'total_points', 'trend_emoji'
-            ]].copy()
-
-            display_all.columns = [
-                'Player', 'Team', 'GP',
-                'Season Avg', 'Last Game', 'Last 5 Avg', 'Total Pts', 'Trend'
-            ]
-
             st.dataframe(
-                display_all,
+                display_stats,
                 hide_index=True,
-                use_container_width=True
+                use_container_width=True,
+                column_config=PLAYER_STATS_COLUMNS
             )
         else:
             st.info("No player stats available yet. Stats will appear after game data is uploaded.")
 
-    with tab6:
+    elif active_tab == "Transaction Log":
         st.header("Transaction Log")
 
         # Load transaction log
-        transactions = data_loader.load_transaction_log()
+        transactions = _load_transaction_log()
 
         if transactions is not None and not transactions.empty:
-            # Filter to this manager's transactions
-            my_transactions = transactions[transactions['manager_id'] == manager_id]
-
-            if not my_transactions.empty:
-                # Sort by timestamp descending
-                my_transactions = my_transactions.sort_values('timestamp', ascending=False)
+            # This manager's transactions, already sorted newest first
+            my_transactions = _transactions_by_manager().get(manager_id)
 
+            if my_transactions is not None:
                 st.subheader("Your Recent Lineup Changes")
 
                 # Display transaction log
@@ -565,7 +634,7 @@ if selected_option != "-- Select Manager --":
                 display_transactions.columns = ['Timestamp', 'Game Date', 'Active Players']
 
                 # Format timestamp
-                display_transactions['Timestamp'] = pd.to_datetime(display_transactions['Timestamp']).dt.strftime('%Y-%m-%d %H:%M')
+                display_transactions['Timestamp'] = display_transactions['Timestamp'].dt.strftime('%Y-%m-%d %H:%M')
 
                 st.dataframe(
                     display_transactions,
@@ -579,8 +648,10 @@ if selected_option != "-- Select Manager --":
             if st.checkbox("Show all managers' transactions"):
                 st.subheader("All Lineup Changes")
 
-                # Merge with manager names
-                all_trans_display = transactions.merge(
+                # Merge with manager names (only the displayed columns)
+                all_trans_display = transactions[[
+                    'timestamp', 'manager_id', 'game_date', 'active_players'
+                ]].merge(
                     managers[['manager_id', 'team_name']],
                     on='manager_id',
                     how='left'
@@ -593,7 +664,7 @@ if selected_option != "-- Select Manager --":
                 ]].copy()
 
                 display_all_trans.columns = ['Timestamp', 'Team', 'Game Date', 'Active Players']
-                display_all_trans['Timestamp'] = pd.to_datetime(display_all_trans['Timestamp']).dt.strftime('%Y-%m-%d %H:%M')
+                display_all_trans['Timestamp'] = display_all_trans['Timestamp'].dt.strftime('%Y-%m-%d %H:%M')
 
                 st.dataframe(
                     display_all_trans,
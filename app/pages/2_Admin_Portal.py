@@ -6,7 +6,11 @@ import os
 from pathlib import Path
 from datetime import date
 import pandas as pd
+import numpy as np
+import pyarrow as pa
 import io
+import shutil
+import time
 import zipfile
 
 # Add parent directory to path
@@ -17,6 +21,91 @@ from etl.config import DRAFT_ROUNDS, TOTAL_DRAFT_PICKS
 
 st.set_page_config(page_title="Admin Portal", page_icon="⚙️")
 
+
+# Backup files at or below this size are stored rather than deflated
+BACKUP_DEFLATE_MIN_BYTES = 64 * 1024
+
+# One-row example for the Upload Stats format help (constant, so not rebuilt per rerun)
+EXAMPLE_CSV = (
+    "game_id,player_id,PTS,REB,AST,STL,BLK,TOV,PF,GAME_WINNER,DUNK\n"
+    "1,43,19,8,4,2,1,2,2,0,1\n"
+)
+
+
+@st.cache_resource(ttl=3600, show_spinner=False)
+def _schedule_table():
+    # Immutable Arrow table handed to st.dataframe as-is, so the pandas -> Arrow
+    # conversion happens once rather than on every render of the schedule expander
+    return pa.Table.from_pandas(data_loader.load_game_schedule(), preserve_index=False)
+
+
+@st.cache_data(show_spinner=False)
+def _snake_order(draft_order: tuple):
+    # Pure function of the draft order - keyed by it, so randomizing recomputes
+    return draft_engine.snake_order_arrays(list(draft_order), num_rounds=DRAFT_ROUNDS)
+
+
+@st.cache_data(ttl=3600, show_spinner=False)
+def _manager_name_by_id():
+    managers = data_loader.load_managers()
+    return dict(zip(managers['manager_id'].tolist(), managers['manager_name'].tolist()))
+
+
+@st.cache_data(ttl=3600, show_spinner=False)
+def _team_name_by_id():
+    managers = data_loader.load_managers()
+    return dict(zip(managers['manager_id'].tolist(), managers['team_name'].tolist()))
+
+
+@st.cache_data(ttl=60, show_spinner=False)
+def _draft_pool():
+    # Draftable (non-injured) players as parallel arrays: ids and "Name (Team)" labels
+    players = data_loader.load_players()
+    if 'status' in players.columns:
+        players = players[players['status'] != 'injured']
+    labels = players['player_name'] + ' (' + players['team'].fillna('N/A') + ')'
+    return players['player_id'].to_numpy(), labels.to_numpy()
+
+
+@st.cache_data(max_entries=4, show_spinner=False)
+def _parse_stats_upload(data: bytes):
+    # Keyed on the file bytes, so the form submit rerun reuses the preview's parse.
+    # Multithreaded Arrow CSV reader; Arrow-backed columns write back out unchanged
+    return pd.read_csv(io.BytesIO(data), engine="pyarrow", dtype_backend="pyarrow")
+
+
+def _backup_zip() -> bytes:
+    # Zip of every non-empty processed CSV and game stats file, paths relative to data/
+    data_dir = Path(__file__).parent.parent.parent / "data"
+    backup_files = [
+        *data_dir.glob("processed/*.csv"),
+        *data_dir.glob("source/game_stats/*.csv")
+    ]
+
+    zip_buffer = io.BytesIO()
+    with zipfile.ZipFile(zip_buffer, 'w') as zip_file:
+        for csv_file in backup_files:
+            # One stat per file feeds the size filter and the zip entry's metadata
+            file_stat = csv_file.stat()
+            if file_stat.st_size == 0:
+                continue
+
+            zinfo = zipfile.ZipInfo(
+                csv_file.relative_to(data_dir).as_posix(),
+                date_time=time.localtime(file_stat.st_mtime)[:6]
+            )
+            zinfo.external_attr = (file_stat.st_mode & 0xFFFF) << 16
+
+            # Larger files are deflated at the fastest zlib level
+            if file_stat.st_size > BACKUP_DEFLATE_MIN_BYTES:
+                zip_file.writestr(zinfo, csv_file.read_bytes(),
+                                  compress_type=zipfile.ZIP_DEFLATED, compresslevel=1)
+            else:
+                zip_file.writestr(zinfo, csv_file.read_bytes(), compress_type=zipfile.ZIP_STORED)
+
+    return zip_buffer.getvalue()
+
+
 st.title("⚙️ Admin Portal")
 
 # Backup/Restore section at the top
@@ -26,31 +115,10 @@ col1, col2 = st.columns(2)
 
 with col1:
     if st.button("📦 Download All Data (Zip)", type="primary", use_container_width=True):
-        # Create zip file in memory
-        zip_buffer = io.BytesIO()
-
-        with zipfile.ZipFile(zip_buffer, 'w', zipfile.ZIP_DEFLATED) as zip_file:
-            # Define all files to backup
-            processed_dir = Path(__file__).parent.parent.parent / "data/processed"
-            source_dir = Path(__file__).parent.parent.parent / "data/source"
-
-            # Add all processed CSVs
-            for csv_file in processed_dir.glob("*.csv"):
-                if csv_file.exists() and csv_file.stat().st_size > 0:
-                    zip_file.write(csv_file, f"processed/{csv_file.name}")
-
-            # Add game stats
-            game_stats_dir = source_dir / "game_stats"
-            if game_stats_dir.exists():
-                for stats_file in game_stats_dir.glob("*.csv"):
-                    if stats_file.exists() and stats_file.stat().st_size > 0:
-                        zip_file.write(stats_file, f"source/game_stats/{stats_file.name}")
-
-        zip_buffer.seek(0)
-
+        # Zip is only built on request, not on every rerun
         st.download_button(
             label="⬇️ Click to Download",
-            data=zip_buffer,
+            data=_backup_zip(),
             file_name=f"fantasy_league_backup_{date.today()}.zip",
             mime="application/zip"
         )
@@ -66,7 +134,7 @@ with col2:
                     base_dir = Path(__file__).parent.parent.parent / "data"
 
                     # Extract all files (skip directories and Mac metadata)
-                    for file_info in zip_file.filelist:
+                    for file_info in zip_file.infolist():
                         # Skip directory entries
                         if file_info.is_dir():
                             continue
@@ -90,14 +158,18 @@ with col2:
                             # Skip files not in processed or source
                             continue
 
+                        # Never write outside data/ (e.g. 'processed/../../app.py')
+                        if '..' in relative_path.parts:
+                            continue
+
                         target_path = base_dir / relative_path
 
                         # Create parent directories if needed
                         target_path.parent.mkdir(parents=True, exist_ok=True)
 
-                        # Extract file
+                        # Extract file, streamed in 1 MiB chunks
                         with zip_file.open(file_info) as source, open(target_path, 'wb') as target:
-                            target.write(source.read())
+                            shutil.copyfileobj(source, target, 1024 * 1024)
 
                         # Verify file exists and get size
                         if target_path.exists():
@@ -105,6 +177,10 @@ with col2:
                         else:
                             extracted_files.append(f"{relative_path} (FAILED)")
 
+                # Restored files replace everything the cached loaders have read
+                st.cache_data.clear()
+                st.cache_resource.clear()
+
                 st.success(f"✅ Extracted {len(extracted_files)} files:")
                 for f in extracted_files:
                     st.text(f"  • {f}")
@@ -144,6 +220,11 @@ with tab1:
                 os.remove(roster_file)
             if temp_file.exists():
                 os.remove(temp_file)
+            st.cache_data.clear()  # cached draft status, rosters and draft results
+            # Drop in-memory draft state so the rerun starts a fresh draft
+            st.session_state.pop('draft_picks', None)
+            st.session_state.pop('draft_order', None)
+            st.session_state.pop('drafted_arr', None)
 
             st.success("Draft cleared! Refresh to start new draft.")
             st.rerun()
@@ -152,9 +233,8 @@ with tab1:
 
         st.subheader("Simple Draft Interface")
 
-        # Load managers and players
+        # Load managers
         managers = data_loader.load_managers()
-        players = data_loader.load_players()
 
         # Initialize draft state
         if 'draft_picks' not in st.session_state:
@@ -174,6 +254,11 @@ with tab1:
             else:
                 st.session_state.draft_picks = []
                 st.session_state.draft_order = managers['manager_id'].tolist()
+            # Drafted player ids, preallocated and filled in pick order
+            st.session_state.drafted_arr = np.empty(TOTAL_DRAFT_PICKS, dtype=np.int16)
+            st.session_state.drafted_arr[:len(st.session_state.draft_picks)] = [
+                pid for _, pid in st.session_state.draft_picks
+            ]
 
         # Show current draft order with randomize option
         current_pick_num = len(st.session_state.draft_picks) + 1
@@ -181,10 +266,11 @@ with tab1:
         if current_pick_num == 1:
             # Show draft order and randomize button before first pick
             st.info("**Draft Order:**")
-            order_display = []
-            for idx, mgr_id in enumerate(st.session_state.draft_order, 1):
-                mgr_name = managers[managers['manager_id'] == mgr_id]['manager_name'].iloc[0]
-                order_display.append(f"{idx}. {mgr_name}")
+            manager_name_by_id = _manager_name_by_id()
+            order_display = [
+                f"{idx}. {manager_name_by_id[mgr_id]}"
+                for idx, mgr_id in enumerate(st.session_state.draft_order, 1)
+            ]
             st.write(" → ".join(order_display))
 
             if st.button("🎲 Randomize Draft Order"):
@@ -195,50 +281,53 @@ with tab1:
             st.divider()
 
         # Generate snake order
-        snake_order = draft_engine.create_snake_order(st.session_state.draft_order, num_rounds=DRAFT_ROUNDS)
+        round_of_pick, manager_of_pick = _snake_order(tuple(st.session_state.draft_order))
 
         if current_pick_num <= TOTAL_DRAFT_PICKS:
             # Get current pick info
-            _, round_num, manager_id = snake_order[current_pick_num - 1]
-            manager_result = managers[managers['manager_id'] == manager_id]['manager_name']
-            if manager_result.empty:
+            round_num = int(round_of_pick[current_pick_num - 1])
+            manager_id = int(manager_of_pick[current_pick_num - 1])
+            manager_name = _manager_name_by_id().get(manager_id)
+            if manager_name is None:
                 st.error(f"❌ Manager ID {manager_id} not found!")
                 st.stop()
 
-            manager_name = manager_result.iloc[0]
             st.write(f"**Pick #{current_pick_num}** - Round {round_num} - {manager_name}")
 
-            # Get available players
-            drafted_ids = [pid for _, pid in st.session_state.draft_picks]
-            available = players[~players['player_id'].isin(drafted_ids)]
-
-            # Filter out injured players
-            if 'status' in available.columns:
-                available = available[available['status'] != 'injured']
-
-            # Player selection
-            player_options = {
-                f"{row['player_name']} ({row['team']})": row['player_id']
-                for _, row in available.iterrows()
-            }
-
-            selected_player = st.selectbox(
-                "Select Player:",
-                options=list(player_options.keys())
-            )
+            # Get available players: drafted-id mask gathered over the draftable pool
+            pool_ids, pool_labels = _draft_pool()
+            drafted_ids = st.session_state.drafted_arr[:len(st.session_state.draft_picks)]
+            drafted_mask = np.zeros(max(pool_ids.max(initial=0), drafted_ids.max(initial=0)) + 1, dtype=bool)
+            drafted_mask[drafted_ids] = True
+            keep = ~drafted_mask[pool_ids]
+            option_ids = pool_ids[keep]
+            option_labels = pool_labels[keep]
+
+            # Player selection (by position in the available arrays); the form keeps
+            # browsing the selectbox from rerunning the page until the pick is made
+            with st.form("pick_form"):
+                selected_pos = st.selectbox(
+                    "Select Player:",
+                    options=range(len(option_ids)),
+                    format_func=lambda i: option_labels[i]
+                )
+                make_pick = st.form_submit_button("Make Pick")
 
-            if st.button("Make Pick"):
-                player_id = player_options[selected_player]
+            if make_pick and selected_pos is not None:
+                player_id = int(option_ids[selected_pos])
                 st.session_state.draft_picks.append((current_pick_num, player_id))
+                st.session_state.drafted_arr[current_pick_num - 1] = player_id
 
-                # Auto-save draft progress (recover from interruption)
+                # Auto-save draft progress (recover from interruption); written to a
+                # sibling file and swapped in so a rerun mid-write can't leave it torn
                 import json
                 temp_file = Path(__file__).parent.parent.parent / "data/processed/draft_temp.json"
-                with open(temp_file, 'w') as f:
-                    json.dump({
-                        'picks': st.session_state.draft_picks,
-                        'order': st.session_state.draft_order
-                    }, f)
+                partial_file = temp_file.with_suffix('.json.tmp')
+                partial_file.write_text(json.dumps({
+                    'picks': st.session_state.draft_picks,
+                    'order': st.session_state.draft_order
+                }))
+                os.replace(partial_file, temp_file)
 
                 st.rerun()
 
@@ -255,6 +344,7 @@ with tab1:
                     st.session_state.draft_order
                 )
                 draft_engine.save_draft(draft_df, rosters_df)
+                st.cache_data.clear()  # Manager Portal caches draft status and rosters
 
                 # Delete temp file
                 temp_file = Path(__file__).parent.parent.parent / "data/processed/draft_temp.json"
@@ -270,8 +360,8 @@ with tab2:
 
     # Show game schedule for reference
     with st.expander("📅 View Game Schedule (for game_id reference)"):
-        schedule = data_loader.load_game_schedule()
-        if not schedule.empty:
+        schedule = _schedule_table()
+        if schedule.num_rows > 0:
             st.dataframe(schedule, hide_index=True, use_container_width=True)
         else:
             st.info("No games in schedule yet. Add games to data/handmade/game_schedule.csv")
@@ -282,20 +372,23 @@ with tab2:
 
     if uploaded_file is not None:
         try:
-            df = pd.read_csv(uploaded_file)
+            df = _parse_stats_upload(uploaded_file.getvalue())
 
             st.write("Preview:")
             st.dataframe(df.head(), use_container_width=True)
 
             # Get game info
-            game_date = st.date_input(
-                "Game Date:",
-                value=date.today()
-            )
+            with st.form("upload_stats_form"):
+                game_date = st.date_input(
+                    "Game Date:",
+                    value=date.today()
+                )
+
+                game_num = st.number_input("Game Number (for this date):", min_value=1, value=1)
 
-            game_num = st.number_input("Game Number (for this date):", min_value=1, value=1)
+                save_stats = st.form_submit_button("Save Stats and Calculate Scores")
 
-            if st.button("Save Stats and Calculate Scores"):
+            if save_stats:
                 # Validate required columns
                 required_cols = ['game_id', 'player_id', 'PTS',
                                  'REB', 'AST', 'STL', 'BLK', 'TOV', 'PF', 'GAME_WINNER', 'DUNK']
@@ -307,17 +400,23 @@ with tab2:
                 else:
                     # Validate player IDs
                     players = data_loader.load_players()
-                    valid_player_ids = set(players['player_id'].tolist())
-                    invalid_ids = set(df['player_id'].unique()) - valid_player_ids
-
-                    if invalid_ids:
+                    # Non-numeric ids coerce to NaN so they are reported, not raised
+                    is_invalid = ~np.isin(
+                        pd.to_numeric(df['player_id'], errors='coerce').to_numpy(dtype='float64', na_value=np.nan),
+                        players['player_id'].to_numpy()
+                    )
+
+                    if is_invalid.any():
+                        invalid_ids = df.loc[is_invalid, 'player_id'].unique().tolist()
                         st.error(f"❌ Invalid player IDs found: {invalid_ids}")
                         st.info("Player IDs must be between 1-48. Check data/handmade/players.csv")
                     else:
                         # Validate no negative stats (except TOV which has negative scoring)
+                        # One reduction over all stat columns at once
                         stat_cols = ['PTS', 'REB', 'AST', 'STL', 'BLK', 'PF', 'DUNK']
-                        for col in stat_cols:
-                            if (df[col] < 0).any():
+                        has_negative = (df[stat_cols].to_numpy(dtype='float64', na_value=np.nan) < 0).any(axis=0)
+                        for col, negative in zip(stat_cols, has_negative):
+                            if negative:
                                 st.warning(f"⚠️ Warning: Negative values found in {col} column")
 
                         # Add game_date column if not present
@@ -327,15 +426,16 @@ with tab2:
                         # Save game stats
                         data_loader.save_game_stats(df, game_date, game_num)
 
-                        # Calculate scores
-                        score_calculator.update_scores_for_date(game_date)
+                        # Calculate scores (returns the season's manager scores, handed
+                        # straight to the standings update instead of re-reading the CSV)
+                        manager_scores = score_calculator.update_scores_for_date(game_date)
 
                         # Update game_id mapping
                         data_loader.update_game_id_mapping()
                         st.cache_data.clear()  # Clear cache to reload mapping
 
                         # Update standings
-                        standings_updater.update_standings()
+                        standings_updater.update_standings(manager_scores)
 
                         st.success(f"✅ Stats saved and scores updated for {game_date}!")
 
@@ -365,24 +465,9 @@ with tab2:
     """)
 
     # Example CSV download
-    example_df = pd.DataFrame([{
-        'game_id': 1,
-        'player_id': 43,
-        'PTS': 19,
-        'REB': 8,
-        'AST': 4,
-        'STL': 2,
-        'BLK': 1,
-        'TOV': 2,
-        'PF': 2,
-        'GAME_WINNER': 0,
-        'DUNK': 1
-    }])
-
-    csv = example_df.to_csv(index=False)
     st.download_button(
         label="Download Example CSV",
-        data=csv,
+        data=EXAMPLE_CSV,
         file_name="example_game_stats.csv",
         mime="text/csv"
     )
@@ -395,14 +480,23 @@ with tab3:
     players = data_loader.load_players()
 
     if rosters is not None and not rosters.empty:
-        for _, manager in managers.iterrows():
-            with st.expander(f"{manager['team_name']} ({manager['manager_name']})"):
-                manager_roster = draft_engine.get_manager_roster(manager['manager_id'])
-
-                if not manager_roster.empty:
-                    display = manager_roster[['player_name', 'team']].copy()
-                    display.columns = ['Player', 'Unrivaled Team']
-                    st.dataframe(display, hide_index=True, use_container_width=True)
+        # One join + groupby for every roster instead of a roster lookup per manager
+        rosters_display = rosters[['manager_id', 'player_id']].merge(
+            players[['player_id', 'player_name', 'team']], on='player_id', how='left'
+        ).rename(columns={'player_name': 'Player', 'team': 'Unrivaled Team'})
+        rosters_by_manager = {
+            mid: group[['Player', 'Unrivaled Team']]
+            for mid, group in rosters_display.groupby('manager_id')
+        }
+
+        for manager_id, team_name, manager_name in zip(
+            managers['manager_id'], managers['team_name'], managers['manager_name']
+        ):
+            with st.expander(f"{team_name} ({manager_name})"):
+                manager_roster = rosters_by_manager.get(manager_id)
+
+                if manager_roster is not None:
+                    st.dataframe(manager_roster, hide_index=True, use_container_width=True)
     else:
         st.info("No rosters found. Complete draft first.")
 
@@ -422,12 +516,14 @@ with tab4:
 
     st.subheader("Calculate Scores for Specific Date")
 
-    calc_date = st.date_input("Select Date:", value=date.today())
+    with st.form("calc_date_form"):
+        calc_date = st.date_input("Select Date:", value=date.today())
+        calc_for_date = st.form_submit_button("Calculate for This Date")
 
-    if st.button("Calculate for This Date"):
+    if calc_for_date:
         with st.spinner(f"Calculating scores for {calc_date}..."):
-            score_calculator.update_scores_for_date(calc_date)
-            standings_updater.update_standings()
+            manager_scores = score_calculator.update_scores_for_date(calc_date)
+            standings_updater.update_standings(manager_scores)
 
         st.success(f"Scores updated for {calc_date}!")
 
@@ -439,7 +535,6 @@ with tab5:
     # Load players
     players = data_loader.load_players()
     rosters = data_loader.load_rosters()
-    managers = data_loader.load_managers()
 
     if not players.empty:
         # Create tabs for different views
@@ -451,26 +546,24 @@ with tab5:
             # Add search/filter
             search = st.text_input("🔍 Search player name:", "")
 
-            filtered_players = players.copy()
+            filtered_players = players
             if search:
                 filtered_players = filtered_players[
                     filtered_players['player_name'].str.contains(search, case=False, na=False)
                 ]
 
-            # Display players (read-only)
-            for idx, player in filtered_players.iterrows():
-                col1, col2, col3 = st.columns([4, 3, 3])
-
-                with col1:
-                    st.write(f"**{player['player_name']}**")
-
-                with col2:
-                    st.caption(player['team'])
-
-                with col3:
-                    current_status = player['status']
-                    status_emoji = "✅" if current_status == 'active' else "🔴"
-                    st.write(f"{status_emoji} {current_status.title()}")
+            # Display players (read-only) as a single table
+            status = filtered_players['status'].astype(str)
+            status_emoji = np.where(status == 'active', "✅", "🔴")
+            st.dataframe(
+                pd.DataFrame({
+                    'Player': filtered_players['player_name'],
+                    'Unrivaled Team': filtered_players['team'],
+                    'Status': status_emoji + ' ' + status.str.title()
+                }),
+                hide_index=True,
+                use_container_width=True
+            )
 
         with injury_tab2:
             st.subheader("Currently Injured Players")
@@ -478,31 +571,33 @@ with tab5:
             injured = players[players['status'] == 'injured']
 
             if not injured.empty:
-                # Show which managers are affected
-                for _, player in injured.iterrows():
+                # Show which managers are affected: owning manager joined in once
+                owner_ids = [None] * len(injured)
+                if rosters is not None:
+                    owner_ids = injured[['player_id']].merge(
+                        rosters[['player_id', 'manager_id']].drop_duplicates('player_id'),
+                        on='player_id',
+                        how='left'
+                    )['manager_id']
+
+                team_name_by_id = _team_name_by_id()
+                for player_name, team, owner_id in zip(injured['player_name'], injured['team'], owner_ids):
                     col1, col2, col3 = st.columns([4, 3, 3])
 
                     with col1:
-                        st.write(f"**🔴 {player['player_name']}**")
+                        st.write(f"**🔴 {player_name}**")
 
                     with col2:
-                        st.caption(player['team'])
+                        st.caption(team)
 
                     with col3:
                         # Check if player is on a roster
-                        if rosters is not None:
-                            player_roster = rosters[rosters['player_id'] == player['player_id']]
-
-                            if not player_roster.empty:
-                                manager_id = player_roster['manager_id'].iloc[0]
-                                manager = managers[managers['manager_id'] == manager_id]
-
-                                if not manager.empty:
-                                    st.caption(f"Owned by: {manager['team_name'].iloc[0]}")
-                            else:
-                                st.caption("Not drafted")
-                        else:
+                        if rosters is None:
                             st.caption("Draft incomplete")
+                        elif pd.isna(owner_id):
+                            st.caption("Not drafted")
+                        elif owner_id in team_name_by_id:
+                            st.caption(f"Owned by: {team_name_by_id[owner_id]}")
             else:
                 st.success("✅ No injured players! Everyone is healthy.")
 
@@ -526,41 +621,44 @@ with tab6:
         managers = data_loader.load_managers()
         players = data_loader.load_players()
 
+        # Join player details once, then split by (date, manager) in a single pass
+        # lineups 'status' = active/bench; the players' injury status isn't needed here
+        lineups_with_players = lineups.merge(
+            players[['player_id', 'player_name', 'team']],
+            on='player_id',
+            how='left'
+        )
+        lineups_by_date_manager = {
+            key: group
+            for key, group in lineups_with_players.groupby(['game_date', 'manager_id'], sort=False)
+        }
+
         # Get unique dates
         unique_dates = sorted(lineups['game_date'].unique(), reverse=True)
 
         for game_date in unique_dates:
             with st.expander(f"📅 Lineups for {game_date}"):
-                date_lineups = lineups[lineups['game_date'] == game_date]
-
-                for _, manager in managers.iterrows():
-                    manager_lineup = date_lineups[date_lineups['manager_id'] == manager['manager_id']]
-
-                    if not manager_lineup.empty:
-                        st.write(f"**{manager['team_name']}** ({manager['manager_name']})")
+                for manager_id, team_name, manager_name in zip(
+                    managers['manager_id'], managers['team_name'], managers['manager_name']
+                ):
+                    manager_lineup = lineups_by_date_manager.get((game_date, manager_id))
 
-                        # Merge with player details (use suffixes to avoid column name conflicts)
-                        # lineups 'status' = active/bench, players 'status' = active/injured
-                        lineup_with_players = manager_lineup.merge(
-                            players,
-                            on='player_id',
-                            how='left',
-                            suffixes=('_lineup', '_injury')
-                        )
+                    if manager_lineup is not None:
+                        st.write(f"**{team_name}** ({manager_name})")
 
                         # Show active players
-                        active = lineup_with_players[lineup_with_players['status_lineup'] == 'active']
+                        active = manager_lineup[manager_lineup['status'] == 'active']
                         if not active.empty:
                             st.caption("Active:")
-                            for _, p in active.iterrows():
-                                st.write(f"  ✅ {p['player_name']} ({p['team']})")
+                            for player_name, team in zip(active['player_name'], active['team']):
+                                st.write(f"  ✅ {player_name} ({team})")
 
                         # Show bench players
-                        bench = lineup_with_players[lineup_with_players['status_lineup'] == 'bench']
+                        bench = manager_lineup[manager_lineup['status'] == 'bench']
                         if not bench.empty:
                             with st.expander("View Bench"):
-                                for _, p in bench.iterrows():
-                                    st.caption(f"  {p['player_name']} ({p['team']})")
+                                for player_name, team in zip(bench['player_name'], bench['team']):
+                                    st.caption(f"  {player_name} ({team})")
 
                         st.divider()
     else:
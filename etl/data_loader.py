@@ -15,17 +15,46 @@ PROCESSED_DIR = DATA_DIR / "processed"
 GAME_STATS_DIR = SOURCE_DIR / "game_stats"
 TOURNAMENT_STATS_DIR = SOURCE_DIR / "tournament_game_stats"
 
+# Arrow-backed strings hand off to st.dataframe without an object -> Arrow conversion
+STRING_DTYPE = "string[pyarrow]"
+
+
+def _downcast_integers(df: pd.DataFrame, columns: list) -> pd.DataFrame:
+    """Shrink integer id/count columns to the smallest dtype that fits."""
+    for col in columns:
+        if col in df.columns:
+            df[col] = pd.to_numeric(df[col], downcast='integer')
+    return df
+
+
+@st.cache_data(show_spinner=False, max_entries=16)
+def _read_csv_cached(path: str, mtime_ns: int, size: int) -> pd.DataFrame:
+    """Parse a CSV once per on-disk version (mtime/size are only the cache key)."""
+    return pd.read_csv(path)
+
+
+def _read_csv_versioned(path: Path) -> pd.DataFrame:
+    """Read a rarely-changing CSV, reusing the parse until the file is rewritten."""
+    stat = path.stat()
+    return _read_csv_cached(str(path), stat.st_mtime_ns, stat.st_size)
+
 
 @st.cache_data(ttl=3600)  # Cache for 1 hour
 def load_players() -> pd.DataFrame:
     """Load player master list."""
-    return pd.read_csv(HANDMADE_DIR / "players.csv")
+    return pd.read_csv(
+        HANDMADE_DIR / "players.csv",
+        dtype={'player_name': STRING_DTYPE, 'team': STRING_DTYPE, 'status': 'category'}
+    )
 
 
 @st.cache_data(ttl=3600)  # Cache for 1 hour
 def load_managers() -> pd.DataFrame:
     """Load managers/fantasy teams."""
-    return pd.read_csv(HANDMADE_DIR / "managers.csv")
+    return pd.read_csv(
+        HANDMADE_DIR / "managers.csv",
+        dtype={'manager_name': STRING_DTYPE, 'team_name': STRING_DTYPE}
+    )
 
 
 @st.cache_data(ttl=3600)  # Cache for 1 hour
@@ -37,7 +66,10 @@ def load_scoring_config() -> pd.DataFrame:
 @st.cache_data(ttl=3600)  # Cache for 1 hour
 def load_game_schedule() -> pd.DataFrame:
     """Load game schedule with times."""
-    df = pd.read_csv(HANDMADE_DIR / "game_schedule.csv")
+    df = pd.read_csv(
+        HANDMADE_DIR / "game_schedule.csv",
+        dtype={'home_team': STRING_DTYPE, 'away_team': STRING_DTYPE, 'status': STRING_DTYPE}
+    )
     df['game_date'] = pd.to_datetime(df['game_date']).dt.date
     df['game_time'] = pd.to_datetime(df['game_time'], format='%H:%M').dt.time
     return df
@@ -93,7 +125,7 @@ def load_draft_results() -> Optional[pd.DataFrame]:
     """Load draft results if exists."""
     path = PROCESSED_DIR / "draft_results.csv"
     if path.exists():
-        return pd.read_csv(path)
+        return _read_csv_versioned(path)
     return None
 
 
@@ -101,7 +133,7 @@ def load_rosters() -> Optional[pd.DataFrame]:
     """Load current rosters if exists."""
     path = PROCESSED_DIR / "rosters.csv"
     if path.exists():
-        df = pd.read_csv(path)
+        df = _read_csv_versioned(path)
         df['acquisition_date'] = pd.to_datetime(df['acquisition_date']).dt.date
         return df
     return None
@@ -121,6 +153,7 @@ def load_lineups(game_date: Optional[date] = None) -> Optional[pd.DataFrame]:
 
     df['game_date'] = pd.to_datetime(df['game_date']).dt.date
     df['locked_at'] = pd.to_datetime(df['locked_at'], errors='coerce')
+    df['status'] = df['status'].astype('category')  # active/bench
 
     if game_date:
         df = df[df['game_date'] == game_date]
@@ -128,8 +161,8 @@ def load_lineups(game_date: Optional[date] = None) -> Optional[pd.DataFrame]:
     return df
 
 
-def load_game_stats(game_date: Optional[date] = None) -> pd.DataFrame:
-    """Load game stats, optionally filtered by date."""
+def load_game_stats(game_date: Optional[date] = None, columns: Optional[list] = None) -> pd.DataFrame:
+    """Load game stats, optionally filtered by date and restricted to a subset of columns."""
     all_stats = []
 
     if game_date:
@@ -140,8 +173,9 @@ def load_game_stats(game_date: Optional[date] = None) -> pd.DataFrame:
         # Load all game stats
         files = list(GAME_STATS_DIR.glob("*_game*.csv"))
 
+    usecols = (lambda col: col in columns) if columns is not None else None
     for file in sorted(files):
-        df = pd.read_csv(file)
+        df = pd.read_csv(file, usecols=usecols)
         all_stats.append(df)
 
     if all_stats:
@@ -161,7 +195,9 @@ def load_player_game_scores() -> Optional[pd.DataFrame]:
             if df.empty:
                 return None
             df['game_date'] = pd.to_datetime(df['game_date']).dt.date
-            return df
+            if 'status' in df.columns:
+                df['status'] = df['status'].astype('category')  # played/dnp
+            return _downcast_integers(df, ['game_id', 'player_id'])
         except Exception:
             return None
     return None
@@ -173,7 +209,7 @@ def load_manager_daily_scores() -> Optional[pd.DataFrame]:
     if path.exists():
         df = pd.read_csv(path)
         df['game_date'] = pd.to_datetime(df['game_date']).dt.date
-        return df
+        return _downcast_integers(df, ['manager_id', 'active_players_count'])
     return None
 
 
@@ -218,11 +254,13 @@ def save_csv(df: pd.DataFrame, file_path: Path, index: bool = False) -> None:
 def save_draft_results(df: pd.DataFrame) -> None:
     """Save draft results."""
     save_csv(df, PROCESSED_DIR / "draft_results.csv")
+    _read_csv_cached.clear()  # don't rely on mtime granularity for back-to-back writes
 
 
 def save_rosters(df: pd.DataFrame) -> None:
     """Save rosters."""
     save_csv(df, PROCESSED_DIR / "rosters.csv")
+    _read_csv_cached.clear()
 
 
 def save_lineups(df: pd.DataFrame) -> None:
@@ -258,7 +296,10 @@ def save_game_stats(df: pd.DataFrame, game_date: date, game_num: int) -> None:
 
 def load_transaction_log() -> Optional[pd.DataFrame]:
     """Load transaction history log."""
-    return load_csv(PROCESSED_DIR / "transaction_log.csv")
+    df = load_csv(PROCESSED_DIR / "transaction_log.csv")
+    if df is not None and 'timestamp' in df.columns:
+        df['timestamp'] = pd.to_datetime(df['timestamp'], format='ISO8601')
+    return df
 
 
 def save_transaction_log(df: pd.DataFrame) -> None:
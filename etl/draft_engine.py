@@ -1,5 +1,6 @@
 """Snake draft engine for fantasy league."""
 
+import numpy as np
 import pandas as pd
 from datetime import datetime, date
 from typing import List, Tuple
@@ -34,6 +35,27 @@ def create_snake_order(manager_ids: List[int], num_rounds: int = 9) -> List[Tupl
     return draft_order
 
 
+def snake_order_arrays(manager_ids: List[int], num_rounds: int = 9) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Generate snake draft order as pick-indexed lookup arrays.
+
+    Args:
+        manager_ids: List of manager IDs in initial draft order
+        num_rounds: Number of draft rounds (default: 9 for 9-player rosters)
+
+    Returns:
+        (round_of_pick, manager_of_pick) int16 arrays; index i holds pick number i + 1
+    """
+    num_managers = len(manager_ids)
+    round_of_pick = np.repeat(np.arange(1, num_rounds + 1, dtype=np.int16), num_managers)
+
+    # One row per round; even rounds run in reverse (snake)
+    manager_grid = np.tile(np.asarray(manager_ids, dtype=np.int16), (num_rounds, 1))
+    manager_grid[1::2] = manager_grid[1::2, ::-1]
+
+    return round_of_pick, manager_grid.ravel()
+
+
 def execute_draft(draft_picks: List[Tuple[int, int]], draft_order: List[int] = None) -> Tuple[pd.DataFrame, pd.DataFrame]:
     """
     Execute draft and create results.
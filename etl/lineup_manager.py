@@ -1,6 +1,7 @@
 """Lineup management, validation, and locking logic."""
 
 import pandas as pd
+from bisect import bisect_left
 from datetime import datetime, date, time, timedelta
 from typing import List, Optional
 from zoneinfo import ZoneInfo
@@ -240,7 +241,8 @@ def save_lineup(manager_id: int, game_date: date, active_player_ids: List[int])
     return False, "Failed to save lineup"
 
 
-def get_active_players_for_scoring(manager_id: int, game_date: date) -> List[int]:
+def get_active_players_for_scoring(manager_id: int, game_date: date,
+                                   lineups: Optional[pd.DataFrame] = None) -> List[int]:
     """
     Get list of active player IDs for a manager on a date.
 
@@ -252,11 +254,15 @@ def get_active_players_for_scoring(manager_id: int, game_date: date) -> List[int
     Args:
         manager_id: Manager ID
         game_date: Date to check
+        lineups: Optional lineups DataFrame (loads from file if not provided)
 
     Returns:
         List of player IDs set as active
     """
-    lineup = get_manager_lineup(manager_id, game_date)
+    if lineups is None:
+        lineup = get_manager_lineup(manager_id, game_date)
+    else:
+        lineup = lineups[(lineups['manager_id'] == manager_id) & (lineups['game_date'] == game_date)]
 
     if not lineup.empty and 'status' in lineup.columns and 'player_id' in lineup.columns:
         # Lineup exists for this date
@@ -264,7 +270,7 @@ def get_active_players_for_scoring(manager_id: int, game_date: date) -> List[int
         return active['player_id'].tolist()
 
     # No lineup for today - look for most recent previous lineup
-    all_lineups = data_loader.load_lineups()
+    all_lineups = lineups if lineups is not None else data_loader.load_lineups()
 
     if all_lineups is not None and not all_lineups.empty and 'manager_id' in all_lineups.columns:
         manager_lineups = all_lineups[all_lineups['manager_id'] == manager_id]
@@ -297,6 +303,48 @@ def get_active_players_for_scoring(manager_id: int, game_date: date) -> List[int
     return []
 
 
+def lineup_dates_by_manager(lineups: Optional[pd.DataFrame] = None) -> dict:
+    """
+    Group the dates each manager has a lineup saved for.
+
+    Args:
+        lineups: Optional lineups DataFrame (loads from file if not provided)
+
+    Returns:
+        Dict of manager_id -> sorted list of distinct lineup dates
+    """
+    if lineups is None:
+        lineups = data_loader.load_lineups()
+
+    if lineups is None or lineups.empty:
+        return {}
+
+    dates = lineups[['manager_id', 'game_date']].drop_duplicates().sort_values(['manager_id', 'game_date'])
+    return {mid: group.tolist() for mid, group in dates.groupby('manager_id')['game_date']}
+
+
+def has_prior_lineup(manager_id: int, game_date: date, lineups: Optional[pd.DataFrame] = None,
+                     dates_by_manager: Optional[dict] = None) -> bool:
+    """
+    Check if a manager has a lineup saved for any date before game_date.
+
+    Args:
+        manager_id: Manager ID
+        game_date: Date to check against
+        lineups: Optional lineups DataFrame (loads from file if not provided)
+        dates_by_manager: Optional precomputed lineup_dates_by_manager() result; pass it
+            when checking many managers/dates so lineups are grouped only once
+
+    Returns:
+        True if a previous lineup exists (sticky lineup applies), False otherwise
+    """
+    if dates_by_manager is None:
+        dates_by_manager = lineup_dates_by_manager(lineups)
+
+    # Any saved date sorting before game_date means a prior lineup exists
+    return bisect_left(dates_by_manager.get(manager_id, []), game_date) > 0
+
+
 def auto_create_missing_lineups(game_date: date) -> int:
     """
     Auto-create default lineups for managers who have never set a lineup.
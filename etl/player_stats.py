@@ -144,4 +144,5 @@ def get_all_player_stats() -> pd.DataFrame:
         return pd.DataFrame()
 
     df = pd.DataFrame(player_stats)
+    df['trend'] = df['trend'].astype('category')
     return df.sort_values('season_avg', ascending=False)
@@ -1,11 +1,21 @@
 """Fantasy points calculation engine."""
 
+import numpy as np
 import pandas as pd
 from datetime import date
 from typing import Optional
 from etl import data_loader, lineup_manager
 
 
+def _weighted_stat_sum(game_stats: pd.DataFrame, weights: dict) -> np.ndarray:
+    """Sum stat columns times their weights in one float64 buffer (missing stats count as 0)."""
+    total = np.zeros(len(game_stats))
+    for col, weight in weights.items():
+        if col in game_stats.columns:
+            total += game_stats[col].to_numpy(dtype='float64', na_value=0.0) * weight
+    return total
+
+
 def calculate_player_fantasy_points(game_stats: pd.DataFrame, scoring_config: Optional[pd.DataFrame] = None) -> pd.DataFrame:
     """
     Calculate fantasy points for players based on game stats.
@@ -28,11 +38,7 @@ def calculate_player_fantasy_points(game_stats: pd.DataFrame, scoring_config: Op
 
     # Calculate fantasy points
     game_stats = game_stats.copy()
-    game_stats['fantasy_points'] = 0.0
-
-    for stat_category, points_per_unit in scoring_dict.items():
-        if stat_category in game_stats.columns:
-            game_stats['fantasy_points'] += game_stats[stat_category].fillna(0) * points_per_unit
+    game_stats['fantasy_points'] = _weighted_stat_sum(game_stats, scoring_dict)
 
     # Handle status column: preserve manual status if provided, otherwise auto-detect DNP
     if 'status' not in game_stats.columns:
@@ -41,8 +47,8 @@ def calculate_player_fantasy_points(game_stats: pd.DataFrame, scoring_config: Op
         available_cols = [col for col in stat_cols if col in game_stats.columns]
 
         if available_cols:
-            total_stats = sum(game_stats[col].fillna(0) for col in available_cols)
-            game_stats['status'] = total_stats.apply(lambda x: 'dnp' if x == 0 else 'played')
+            total_stats = _weighted_stat_sum(game_stats, dict.fromkeys(available_cols, 1))
+            game_stats['status'] = np.where(total_stats == 0, 'dnp', 'played')
         else:
             # If we can't determine, assume played
             game_stats['status'] = 'played'
@@ -130,12 +136,15 @@ def calculate_manager_daily_scores(game_date: date) -> pd.DataFrame:
     return pd.DataFrame(manager_game_scores)
 
 
-def update_scores_for_date(game_date: date) -> None:
+def update_scores_for_date(game_date: date) -> Optional[pd.DataFrame]:
     """
     Recalculate all scores for a specific date.
 
     Args:
         game_date: Date to update scores for
+
+    Returns:
+        Updated manager daily scores for the whole season (None if no stats for the date)
     """
     # Load game stats for this date
     game_stats = data_loader.load_game_stats(game_date)
@@ -192,6 +201,8 @@ def update_scores_for_date(game_date: date) -> None:
     print(f"  - {len(player_scores)} player game scores calculated")
     print(f"  - {len(manager_scores)} manager daily scores calculated")
 
+    return updated_manager_scores
+
 
 def update_all_scores() -> None:
     """
@@ -201,8 +212,8 @@ def update_all_scores() -> None:
     - player_game_scores.csv
     - manager_daily_scores.csv
     """
-    # Load all game stats
-    all_game_stats = data_loader.load_game_stats()
+    # Only the dates are needed here; each date's stats are loaded by update_scores_for_date
+    all_game_stats = data_loader.load_game_stats(columns=['game_id', 'game_date'])
 
     if all_game_stats.empty:
         print("No game stats found")
@@ -271,11 +282,7 @@ def calculate_tournament_fantasy_points(game_stats: pd.DataFrame) -> pd.DataFram
     ))
 
     game_stats = game_stats.copy()
-    game_stats['fantasy_points'] = 0.0
-
-    for stat_category, points_per_unit in scoring_dict.items():
-        if stat_category in game_stats.columns:
-            game_stats['fantasy_points'] += game_stats[stat_category].fillna(0) * points_per_unit
+    game_stats['fantasy_points'] = _weighted_stat_sum(game_stats, scoring_dict)
 
     # Round to 2 decimal places
     game_stats['fantasy_points'] = game_stats['fantasy_points'].round(2)
@@ -2,18 +2,23 @@
 
 import pandas as pd
 from datetime import datetime
+from typing import Optional
 from etl import data_loader
 
 
-def calculate_standings() -> pd.DataFrame:
+def calculate_standings(manager_scores: Optional[pd.DataFrame] = None) -> pd.DataFrame:
     """
     Calculate league standings based on season-long total points.
 
+    Args:
+        manager_scores: Optional manager daily scores (loads from file if not provided)
+
     Returns:
         DataFrame with manager_id, total_points, games_with_scores, avg_points_per_day, rank, last_updated
     """
     # Load manager daily scores
-    manager_scores = data_loader.load_manager_daily_scores()
+    if manager_scores is None:
+        manager_scores = data_loader.load_manager_daily_scores()
 
     if manager_scores is None or manager_scores.empty:
         # No scores yet, return standings with all managers tied at rank 1-N
@@ -91,14 +96,17 @@ def calculate_standings() -> pd.DataFrame:
     return standings
 
 
-def update_standings() -> pd.DataFrame:
+def update_standings(manager_scores: Optional[pd.DataFrame] = None) -> pd.DataFrame:
     """
     Calculate and save updated standings.
 
+    Args:
+        manager_scores: Optional manager daily scores (loads from file if not provided)
+
     Returns:
         Updated standings DataFrame
     """
-    standings = calculate_standings()
+    standings = calculate_standings(manager_scores)
     data_loader.save_standings(standings)
 
     return standings
@@ -11,7 +11,7 @@ sys.path.insert(0, str(Path(__file__).parent.parent))
 from etl import data_loader, draft_engine, lineup_manager, score_calculator, standings_updater
 from etl.config import (
     NUM_MANAGERS, PLAYERS_PER_MANAGER, TOTAL_DRAFT_PICKS,
-    ACTIVE_PLAYERS_PER_DAY, SEASON_START
+    ACTIVE_PLAYERS_PER_DAY, SEASON_START, DRAFT_ROUNDS
 )
 
 # Try to import pytest, but don't require it
@@ -447,6 +447,44 @@ class TestSeasonSimulation:
 
         print("\n✅ Complete season simulation successful!")
 
+    def test_10_standings_from_returned_scores(self):
+        """Test that standings from update_scores_for_date's return match standings read from disk."""
+        print("\n=== TEST 10: Standings From Returned Scores ===")
+
+        game_date = SEASON_START
+
+        # Ensure there are stats to score for this date
+        if data_loader.load_game_stats(game_date).empty:
+            self.test_04_upload_game_stats_and_calculate_scores()
+
+        manager_scores = score_calculator.update_scores_for_date(game_date)
+        assert manager_scores is not None and not manager_scores.empty, \
+            "Should return the updated manager scores"
+
+        # last_updated is a timestamp taken at call time, so it always differs
+        from_returned = standings_updater.calculate_standings(manager_scores=manager_scores)
+        from_disk = standings_updater.calculate_standings()
+        pd.testing.assert_frame_equal(
+            from_returned.drop(columns='last_updated'),
+            from_disk.drop(columns='last_updated'),
+            check_dtype=False
+        )
+
+        print(f"✅ Standings match for {len(from_returned)} managers")
+
+    def test_11_update_scores_without_stats(self):
+        """Test that updating scores for a date without stats returns None."""
+        print("\n=== TEST 11: Update Scores Without Stats ===")
+
+        # No games are played before the season starts
+        game_date = SEASON_START - timedelta(days=1)
+        assert data_loader.load_game_stats(game_date).empty, f"Expected no stats for {game_date}"
+
+        assert score_calculator.update_scores_for_date(game_date) is None, \
+            "Should return None when there are no stats for the date"
+
+        print(f"✅ No scores updated for {game_date}")
+
 
 def test_config_constants():
     """Test that config constants are set correctly."""
@@ -461,6 +499,89 @@ def test_config_constants():
     print("✅ All config constants correct")
 
 
+def test_snake_order_arrays():
+    """Test that the snake order lookup arrays match create_snake_order."""
+    print("\n=== Testing Snake Order Arrays ===")
+
+    # Even and odd manager counts
+    for manager_ids in ([3, 1, 4, 2, 8, 5, 7, 6], [2, 7, 5]):
+        snake_order = draft_engine.create_snake_order(manager_ids, num_rounds=DRAFT_ROUNDS)
+        round_of_pick, manager_of_pick = draft_engine.snake_order_arrays(manager_ids, num_rounds=DRAFT_ROUNDS)
+
+        assert len(round_of_pick) == len(manager_of_pick) == len(snake_order), \
+            f"Should have {len(snake_order)} picks for {len(manager_ids)} managers"
+        assert round_of_pick.tolist() == [round_num for _, round_num, _ in snake_order], \
+            f"Rounds should match create_snake_order for {len(manager_ids)} managers"
+        assert manager_of_pick.tolist() == [manager_id for _, _, manager_id in snake_order], \
+            f"Managers should match create_snake_order for {len(manager_ids)} managers"
+
+    print("✅ Snake order arrays match create_snake_order")
+
+
+def test_has_prior_lineup():
+    """Test detection of a lineup saved before a given date."""
+    print("\n=== Testing Prior Lineup Detection ===")
+
+    manager_id = 1
+    game_date = SEASON_START + timedelta(days=7)
+    columns = ['manager_id', 'game_date', 'player_id', 'status']
+
+    # No lineups at all
+    no_lineups = pd.DataFrame(columns=columns)
+    assert not lineup_manager.has_prior_lineup(manager_id, game_date, lineups=no_lineups), \
+        "No lineups should mean no prior lineup"
+
+    # Lineup on an earlier date
+    earlier_lineup = pd.DataFrame([(manager_id, SEASON_START, 1, 'active')], columns=columns)
+    assert lineup_manager.has_prior_lineup(manager_id, game_date, lineups=earlier_lineup), \
+        "Lineup on an earlier date should count as a prior lineup"
+
+    dates_by_manager = lineup_manager.lineup_dates_by_manager(earlier_lineup)
+    assert lineup_manager.has_prior_lineup(manager_id, game_date, dates_by_manager=dates_by_manager), \
+        "Precomputed lineup dates should give the same answer"
+    assert not lineup_manager.has_prior_lineup(manager_id, SEASON_START, dates_by_manager=dates_by_manager), \
+        "A lineup on the checked date itself is not a prior lineup"
+
+    # Lineup only on the same date
+    same_day_lineup = pd.DataFrame([(manager_id, game_date, 1, 'active')], columns=columns)
+    assert not lineup_manager.has_prior_lineup(manager_id, game_date, lineups=same_day_lineup), \
+        "Lineup on the same date should not count as a prior lineup"
+
+    print("✅ Prior lineup detection works")
+
+
+def test_active_players_from_preloaded_lineups():
+    """Test active player lookup against a lineups frame passed in by the caller."""
+    print("\n=== Testing Active Players From Preloaded Lineups ===")
+
+    manager_id = 1
+    date1 = SEASON_START
+    date2 = SEASON_START + timedelta(days=2)
+    lineups = pd.DataFrame(
+        [
+            (manager_id, date1, 1, 'active'), (manager_id, date1, 2, 'active'),
+            (manager_id, date1, 3, 'active'), (manager_id, date1, 4, 'bench'),
+            (manager_id, date2, 4, 'active'), (manager_id, date2, 5, 'active'),
+            (manager_id, date2, 6, 'active'), (manager_id, date2, 1, 'bench'),
+        ],
+        columns=['manager_id', 'game_date', 'player_id', 'status']
+    )
+
+    # Lineup set for the date
+    assert lineup_manager.get_active_players_for_scoring(manager_id, date2, lineups=lineups) == [4, 5, 6], \
+        "Should use the lineup set for the date"
+
+    # Sticky: most recent earlier lineup
+    day_after_date1 = date1 + timedelta(days=1)
+    assert lineup_manager.get_active_players_for_scoring(manager_id, day_after_date1, lineups=lineups) == [1, 2, 3], \
+        "Should fall back to the most recent earlier lineup"
+    week_later = date2 + timedelta(days=7)
+    assert lineup_manager.get_active_players_for_scoring(manager_id, week_later, lineups=lineups) == [4, 5, 6], \
+        "Should fall back to the most recent earlier lineup"
+
+    print("✅ Active players resolved from preloaded lineups")
+
+
 if __name__ == "__main__":
     # Run tests manually
     import traceback
@@ -469,6 +590,9 @@ if __name__ == "__main__":
 
     tests = [
         ("Config Constants", test_config_constants),
+        ("Snake Order Arrays", test_snake_order_arrays),
+        ("Prior Lineup", test_has_prior_lineup),
+        ("Preloaded Lineups", test_active_players_from_preloaded_lineups),
         ("Draft", test_suite.test_01_draft_complete_season),
         ("Lineups", test_suite.test_02_set_lineups_multiple_dates),
         ("Sticky Lineups", test_suite.test_03_sticky_lineup_functionality),
@@ -478,6 +602,8 @@ if __name__ == "__main__":
         ("Tournament", test_suite.test_07_tournament_nominations),
         ("Validation", test_suite.test_08_validation_errors),
         ("Full Season", test_suite.test_09_end_to_end_season),
+        ("Standings From Returned Scores", test_suite.test_10_standings_from_returned_scores),
+        ("Update Scores Without Stats", test_suite.test_11_update_scores_without_stats),
     ]
 
     print("=" * 60)